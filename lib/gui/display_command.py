@@ -137,13 +137,13 @@ class PreviewTrain(DisplayOptionalPage):  # pylint: disable=too-many-ancestors
         preview = PreviewTrainCanvas(self.subnotebook, name)
         preview = self.subnotebook_add_page(name, widget=preview)
         Tooltip(preview, text=self.helptext, wrap_length=200)
-        self.vars["modified"].set(get_images().previewtrain[name][2])
+        self.vars["modified"].set(get_images().previewtrain[name].modified)
 
     def update_child(self, tab_id, name):
         """ Update the preview canvas """
         logger.debug("Updating preview")
-        if self.vars["modified"].get() != get_images().previewtrain[name][2]:
-            self.vars["modified"].set(get_images().previewtrain[name][2])
+        if self.vars["modified"].get() != get_images().previewtrain[name].modified:
+            self.vars["modified"].set(get_images().previewtrain[name].modified)
             widget = self.subnotebook_page_from_id(tab_id)
             widget.reload()
 
@@ -164,7 +164,7 @@ class PreviewTrainCanvas(ttk.Frame):  # pylint: disable=too-many-ancestors
 
         self.name = previewname
         get_images().resize_image(self.name, None)
-        self.previewimage = get_images().previewtrain[self.name][1]
+        self.previewimage = get_images().previewtrain[self.name].tk_image
 
         self.canvas = tk.Canvas(self, bd=0, highlightthickness=0)
         self.canvas.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
@@ -187,7 +187,7 @@ class PreviewTrainCanvas(ttk.Frame):  # pylint: disable=too-many-ancestors
     def reload(self):
         """ Reload the preview image """
         logger.trace("Reloading preview image")
-        self.previewimage = get_images().previewtrain[self.name][1]
+        self.previewimage = get_images().previewtrain[self.name].tk_image
         self.canvas.itemconfig(self.imgcanvas, image=self.previewimage)
 
     def save_preview(self, location):
@@ -195,7 +195,7 @@ class PreviewTrainCanvas(ttk.Frame):  # pylint: disable=too-many-ancestors
         filename = self.name
         now = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = os.path.join(location, f"{filename}_{now}.png")
-        get_images().previewtrain[self.name][0].save(filename)
+        get_images().previewtrain[self.name].image.save(filename)
         logger.debug("Saved preview to %s", filename)
         print(f"Saved preview to {filename}")
 
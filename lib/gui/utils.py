@@ -5,17 +5,22 @@ import logging
 import os
 import platform
 import sys
+import time
 import tkinter as tk
 
+from collections import deque
+from concurrent import futures
 from tkinter import filedialog
 from threading import Event, Thread
-from typing import (Any, Callable, cast, Dict, IO, List, Optional,
-                    Sequence, Tuple, Type, TYPE_CHECKING, Union)
-from queue import Queue
+from typing import (Any, Callable, cast, Deque, Dict, IO, List, Optional,
+                    Set, Tuple, Type, TYPE_CHECKING, Union)
 
 import numpy as np
 
-from PIL import Image, ImageDraw, ImageTk
+from PIL import Image, ImageTk
+
+from lib.serializer import get_serializer
+from lib.utils import FaceswapError
 
 from ._config import Config as UserConfig
 from .project import Project, Tasks
@@ -115,6 +120,104 @@ _FileType = Literal["default", "alignments", "config_project", "config_task",
                     "config_all", "csv", "image", "ini", "state", "log", "video"]
 _HandleType = Literal["open", "save", "filename", "filename_multi", "save_filename",
                       "context", "dir"]
+_IS_LINUX = platform.system().lower() == "linux"
+_ALL_FILES = ("All files", "*.*")
+# The accepted extensions for each file type for opening/saving. Linux file dialogs are case
+# sensitive, so upper case extensions are included. File types with more than one extension have
+# a multi-select option inserted at the start
+_FILETYPES_LINUX: Dict[str, List[Tuple[str, str]]] = dict(
+    default=[_ALL_FILES],
+    alignments=[("Faceswap Alignments", "*.fsa *.FSA"), _ALL_FILES],
+    config_project=[("Faceswap Project files", "*.fsw *.FSW"), _ALL_FILES],
+    config_task=[("Faceswap Task files", "*.fst *.FST"), _ALL_FILES],
+    config_all=[("Faceswap Project and Task files", "*.fst *.fsw *.FST *.FSW"), _ALL_FILES],
+    csv=[("Comma separated values", "*.csv *.CSV"), _ALL_FILES],
+    image=[("Image Files", "*.bmp *.BMP *.jpeg *.jpg *.JPEG *.JPG *.png *.PNG "
+                           "*.tif *.tiff *.TIF *.TIFF"),
+           ("Bitmap", "*.bmp *.BMP"),
+           ("JPG", "*.jpeg *.jpg *.JPEG *.JPG"),
+           ("PNG", "*.png *.PNG"),
+           ("TIFF", "*.tif *.tiff *.TIF *.TIFF"),
+           _ALL_FILES],
+    ini=[("Faceswap config files", "*.ini *.INI"), _ALL_FILES],
+    json=[("JSON file", "*.json *.JSON"), _ALL_FILES],
+    model=[("Keras model files", "*.h5 *.H5"), _ALL_FILES],
+    state=[("State files", "*.json *.JSON"), _ALL_FILES],
+    log=[("Log files", "*.log *.LOG"), _ALL_FILES],
+    video=[("Video Files", "*.avi *.AVI *.flv *.FLV *.mkv *.MKV *.mov *.MOV *.mp4 *.MP4 "
+                           "*.mpeg *.mpg *.ts *.vob *.MPEG *.MPG *.TS *.VOB *.webm *.WEBM "
+                           "*.wmv *.WMV"),
+           ("Audio Video Interleave", "*.avi *.AVI"),
+           ("Flash Video", "*.flv *.FLV"),
+           ("Matroska", "*.mkv *.MKV"),
+           ("MOV", "*.mov *.MOV"),
+           ("MP4", "*.mp4 *.MP4"),
+           ("MPEG", "*.mpeg *.mpg *.ts *.vob *.MPEG *.MPG *.TS *.VOB"),
+           ("WebM", "*.webm *.WEBM"),
+           ("Windows Media Video", "*.wmv *.WMV"),
+           _ALL_FILES])
+_FILETYPES_OTHER: Dict[str, List[Tuple[str, str]]] = dict(
+    default=[_ALL_FILES],
+    alignments=[("Faceswap Alignments", "*.fsa"), _ALL_FILES],
+    config_project=[("Faceswap Project files", "*.fsw"), _ALL_FILES],
+    config_task=[("Faceswap Task files", "*.fst"), _ALL_FILES],
+    config_all=[("Faceswap Project and Task files", "*.fst *.fsw"), _ALL_FILES],
+    csv=[("Comma separated values", "*.csv"), _ALL_FILES],
+    image=[("Image Files", "*.bmp *.jpeg *.jpg *.png *.tif *.tiff"),
+           ("Bitmap", "*.bmp"),
+           ("JPG", "*.jpeg *.jpg"),
+           ("PNG", "*.png"),
+           ("TIFF", "*.tif *.tiff"),
+           _ALL_FILES],
+    ini=[("Faceswap config files", "*.ini"), _ALL_FILES],
+    json=[("JSON file", "*.json"), _ALL_FILES],
+    model=[("Keras model files", "*.h5"), _ALL_FILES],
+    state=[("State files", "*.json"), _ALL_FILES],
+    log=[("Log files", "*.log"), _ALL_FILES],
+    video=[("Video Files", "*.avi *.flv *.mkv *.mov *.mp4 *.mpeg *.mpg *.ts *.vob *.webm *.wmv"),
+           ("Audio Video Interleave", "*.avi"),
+           ("Flash Video", "*.flv"),
+           ("Matroska", "*.mkv"),
+           ("MOV", "*.mov"),
+           ("MP4", "*.mp4"),
+           ("MPEG", "*.mpeg *.mpg *.ts *.vob"),
+           ("WebM", "*.webm"),
+           ("Windows Media Video", "*.wmv"),
+           _ALL_FILES])
+_FILETYPES = _FILETYPES_LINUX if _IS_LINUX else _FILETYPES_OTHER
+# The default file extension for each file type. Generally the first found file type is used,
+# but this is overridden if it is not appropriate
+_DEFAULTS: Dict[str, Optional[str]] = dict(default=None,
+                                           alignments=".fsa",
+                                           config_project=".fsw",
+                                           config_task=".fst",
+                                           config_all=".fst",
+                                           csv=".csv",
+                                           image=".png",
+                                           ini=".ini",
+                                           json=".json",
+                                           model=".h5",
+                                           state=".json",
+                                           log=".log",
+                                           video=".mp4")
+# Mapping of commands, actions and their corresponding file dialog for context handle types
+_CONTEXTS: Dict[str, Dict[str, Union[str, Dict[str, str]]]] = dict(
+    effmpeg=dict(input={"extract": "filename",
+                        "gen-vid": "dir",
+                        "get-fps": "filename",
+                        "get-info": "filename",
+                        "mux-audio": "filename",
+                        "rescale": "filename",
+                        "rotate": "filename",
+                        "slice": "filename"},
+                 output={"extract": "dir",
+                         "gen-vid": "save_filename",
+                         "get-fps": "nothing",
+                         "get-info": "nothing",
+                         "mux-audio": "save_filename",
+                         "rescale": "save_filename",
+                         "rotate": "save_filename",
+                         "slice": "save_filename"}))
 
 
 class FileHandler():  # pylint:disable=too-few-public-methods
@@ -178,7 +281,6 @@ class FileHandler():  # pylint:disable=too-few-public-methods
                      initial_folder, initial_file, command, action, variable)
         self._handletype = handle_type
         self._dummy_master = self._set_dummy_master()
-        self._defaults = self._set_defaults()
         self._kwargs = self._set_kwargs(title,
                                         initial_folder,
                                         initial_file,
@@ -191,72 +293,6 @@ class FileHandler():  # pylint:disable=too-few-public-methods
 
         logger.debug("Initialized %s", self.__class__.__name__)
 
-    @property
-    def _filetypes(self) -> Dict[str, List[Tuple[str, str]]]:
-        """ dict: The accepted extensions for each file type for opening/saving """
-        all_files = ("All files", "*.*")
-        filetypes = dict(
-            default=[all_files],
-            alignments=[("Faceswap Alignments", "*.fsa"), all_files],
-            config_project=[("Faceswap Project files", "*.fsw"), all_files],
-            config_task=[("Faceswap Task files", "*.fst"), all_files],
-            config_all=[("Faceswap Project and Task files", "*.fst *.fsw"), all_files],
-            csv=[("Comma separated values", "*.csv"), all_files],
-            image=[("Bitmap", "*.bmp"),
-                   ("JPG", "*.jpeg *.jpg"),
-                   ("PNG", "*.png"),
-                   ("TIFF", "*.tif *.tiff"),
-                   all_files],
-            ini=[("Faceswap config files", "*.ini"), all_files],
-            json=[("JSON file", "*.json"), all_files],
-            model=[("Keras model files", "*.h5"), all_files],
-            state=[("State files", "*.json"), all_files],
-            log=[("Log files", "*.log"), all_files],
-            video=[("Audio Video Interleave", "*.avi"),
-                   ("Flash Video", "*.flv"),
-                   ("Matroska", "*.mkv"),
-                   ("MOV", "*.mov"),
-                   ("MP4", "*.mp4"),
-                   ("MPEG", "*.mpeg *.mpg *.ts *.vob"),
-                   ("WebM", "*.webm"),
-                   ("Windows Media Video", "*.wmv"),
-                   all_files])
-
-        # Add in multi-select options and upper case extensions for Linux
-        for key in filetypes:
-            if platform.system() == "Linux":
-                filetypes[key] = [item
-                                  if item[0] == "All files"
-                                  else (item[0], f"{item[1]} {item[1].upper()}")
-                                  for item in filetypes[key]]
-            if len(filetypes[key]) > 2:
-                multi = [f"{key.title()} Files"]
-                multi.append(" ".join([ftype[1]
-                                       for ftype in filetypes[key] if ftype[0] != "All files"]))
-                filetypes[key].insert(0, cast(Tuple[str, str], tuple(multi)))
-        return filetypes
-
-    @property
-    def _contexts(self) -> Dict[str, Dict[str, Union[str, Dict[str, str]]]]:
-        """dict: Mapping of commands, actions and their corresponding file dialog for context
-        handle types. """
-        return dict(effmpeg=dict(input={"extract": "filename",
-                                        "gen-vid": "dir",
-                                        "get-fps": "filename",
-                                        "get-info": "filename",
-                                        "mux-audio": "filename",
-                                        "rescale": "filename",
-                                        "rotate": "filename",
-                                        "slice": "filename"},
-                                 output={"extract": "dir",
-                                         "gen-vid": "save_filename",
-                                         "get-fps": "nothing",
-                                         "get-info": "nothing",
-                                         "mux-audio": "save_filename",
-                                         "rescale": "save_filename",
-                                         "rotate": "save_filename",
-                                         "slice": "save_filename"}))
-
     @classmethod
     def _set_dummy_master(cls) -> Optional[tk.Frame]:
         """ Add an option to force black font on Linux file dialogs KDE issue that displays light
@@ -271,7 +307,7 @@ class FileHandler():  # pylint:disable=too-few-public-methods
         tkinter.Frame or ``None``
             The dummy master frame for Linux systems, otherwise ``None``
         """
-        if platform.system().lower() == "linux":
+        if _IS_LINUX:
             frame = tk.Frame()
             frame.option_add("*foreground", "black")
             retval: Optional[tk.Frame] = frame
@@ -281,30 +317,12 @@ class FileHandler():  # pylint:disable=too-few-public-methods
 
     def _remove_dummy_master(self) -> None:
         """ Destroy the dummy master widget on Linux systems. """
-        if platform.system().lower() != "linux" or self._dummy_master is None:
+        if not _IS_LINUX or self._dummy_master is None:
             return
         self._dummy_master.destroy()
         del self._dummy_master
         self._dummy_master = None
 
-    def _set_defaults(self) -> Dict[str, Optional[str]]:
-        """ Set the default file type for the file dialog. Generally the first found file type
-        will be used, but this is overridden if it is not appropriate.
-
-        Returns
-        -------
-        dict:
-            The default file extension for each file type
-        """
-        defaults: Dict[str, Optional[str]] = {
-            key: next(ext for ext in val[0][1].split(" ")).replace("*", "")
-            for key, val in self._filetypes.items()}
-        defaults["default"] = None
-        defaults["video"] = ".mp4"
-        defaults["image"] = ".png"
-        logger.debug(defaults)
-        return defaults
-
     def _set_kwargs(self,
                     title: Optional[str],
                     initial_folder: Optional[str],
@@ -364,9 +382,9 @@ class FileHandler():  # pylint:disable=too-few-public-methods
 
         if self._handletype.lower() in (
                 "open", "save", "filename", "filename_multi", "save_filename"):
-            kwargs["filetypes"] = self._filetypes[file_type]
-            if self._defaults.get(file_type):
-                kwargs['defaultextension'] = self._defaults[file_type]
+            kwargs["filetypes"] = _FILETYPES[file_type]
+            if _DEFAULTS.get(file_type):
+                kwargs['defaultextension'] = _DEFAULTS[file_type]
         if self._handletype.lower() == "save":
             kwargs["mode"] = "w"
         if self._handletype.lower() == "open":
@@ -386,12 +404,12 @@ class FileHandler():  # pylint:disable=too-few-public-methods
         variable: str
             The variable associated with this file dialog
         """
-        if self._contexts[command].get(variable, None) is not None:
+        if _CONTEXTS[command].get(variable, None) is not None:
             handletype = cast(Dict[str, Dict[str, Dict[str, str]]],
-                              self._contexts)[command][variable][action]
+                              _CONTEXTS)[command][variable][action]
         else:
             handletype = cast(Dict[str, Dict[str, str]],
-                              self._contexts)[command][action]
+                              _CONTEXTS)[command][action]
         logger.debug(handletype)
         self._handletype = cast(_HandleType, handletype)
 
@@ -437,6 +455,42 @@ class FileHandler():  # pylint:disable=too-few-public-methods
         return
 
 
+@dataclass
+class _PreviewCache:
+    """ Data class for the extract and convert preview image cache. :attr:`images` is a ring
+    buffer, with :attr:`head` the index that the next image will be written to and
+    :attr:`filled` the number of valid images held. :attr:`skipped_scans` is the number of
+    consecutive checks that have skipped scanning the output folder's files. """
+    modified: Optional[float] = None
+    folder_modified: Optional[Tuple[str, float]] = None
+    skipped_scans: int = 0
+    images: Optional[np.ndarray] = None
+    head: int = 0
+    filled: int = 0
+    filenames: Deque[str] = field(default_factory=deque)
+    placeholder: Optional[np.ndarray] = None
+
+
+@dataclass
+class _PreviewLayout:
+    """ Data class for the grid layout of the extract and convert preview thumbnails, along with
+    the buffer that the thumbnails are placed into for display """
+    frame_dims: Tuple[int, int]
+    thumbnail_size: int
+    cols: int
+    rows: int
+    display: np.ndarray
+
+
+@dataclass
+class _TrainPreview:
+    """ Data class for a single training preview image """
+    image: Image.Image
+    tk_image: Optional[ImageTk.PhotoImage] = None
+    modified: float = 0.0
+    last_size: Optional[Tuple[int, int]] = None
+
+
 class Images():
     """ The centralized image repository for holding all icons and images required by the GUI.
 
@@ -449,17 +503,15 @@ class Images():
         self._pathoutput: Optional[str] = None
         self._batch_mode = False
         self._previewoutput: Optional[Tuple[Image.Image, ImageTk.PhotoImage]] = None
-        self._previewtrain: Dict[str, List[Union[Image.Image,
-                                                 ImageTk.PhotoImage,
-                                                 None,
-                                                 float]]] = {}
-        self._previewcache: Dict[str, Union[None, float, np.ndarray, List[str]]] = dict(
-            modified=None,  # cache for extract and convert
-            images=None,
-            filenames=[],
-            placeholder=None)
+        self._previewtrain: Dict[str, _TrainPreview] = {}
+        self._previewcache = _PreviewCache()  # cache for extract and convert
+        self._full_scan_interval = 5  # Force a scan of the output files every n unchanged checks
+        self._preview_layout: Optional[_PreviewLayout] = None
+        self._executor = futures.ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1),
+                                                    thread_name_prefix=self.__class__.__name__)
+        self._border_templates: Dict[int, np.ndarray] = {}
         self._errcount = 0
-        self._icons = self._load_icons()
+        self._icons: Optional[Dict[str, ImageTk.PhotoImage]] = None
         logger.debug("Initialized %s", self.__class__.__name__)
 
     @property
@@ -473,11 +525,11 @@ class Images():
         return self._previewoutput
 
     @property
-    def previewtrain(self) -> Dict[str, List[Union[Image.Image, ImageTk.PhotoImage, None, float]]]:
+    def previewtrain(self) -> Dict[str, _TrainPreview]:
         """ dict or ``None``: The training preview images. Dictionary key is the image name
-        (`str`). Dictionary values are a `list` of the training image (:class:`PIL.Image`), the
-        image formatted for tkinter display (:class:`PIL.ImageTK.PhotoImage`), the last
-        modification time of the image (`float`).
+        (`str`). Dictionary values are a :class:`_TrainPreview` holding the training image
+        (:class:`PIL.Image`), the image formatted for tkinter display
+        (:class:`PIL.ImageTK.PhotoImage`) and the last modification time of the image (`float`).
 
         The value of this property is ``None`` if training is not running or there are no preview
         images available.
@@ -488,7 +540,7 @@ class Images():
     def icons(self) -> Dict[str, ImageTk.PhotoImage]:
         """ dict: The faceswap icons for all parts of the GUI. The dictionary key is the icon
         name (`str`) the value is the icon sized and formatted for display
-        (:class:`PIL.ImageTK.PhotoImage`).
+        (:class:`PIL.ImageTK.PhotoImage`). The icons are loaded on first access.
 
         Example
         -------
@@ -497,13 +549,18 @@ class Images():
         >>> button = ttk.Button(parent, image=save)
         >>> button.pack()
         """
+        if self._icons is None:
+            self._icons = self._load_icons()
         return self._icons
 
-    @staticmethod
-    def _load_icons() -> Dict[str, ImageTk.PhotoImage]:
+    @classmethod
+    def _load_icons(cls) -> Dict[str, ImageTk.PhotoImage]:
         """ Scan the icons cache folder and load the icons into :attr:`icons` for retrieval
         throughout the GUI.
 
+        The resized raw icon data is cached to disk, so that the source png files only need to be
+        decoded and resized when the icons change or the icon size is altered.
+
         Returns
         -------
         dict:
@@ -512,18 +569,108 @@ class Images():
         """
         size = get_config().user_config_dict.get("icon_size", 16)
         size = int(round(size * get_config().scaling_factor))
-        icons: Dict[str, ImageTk.PhotoImage] = {}
         pathicons = os.path.join(PATHCACHE, "icons")
-        for fname in os.listdir(pathicons):
-            name, ext = os.path.splitext(fname)
-            if ext != ".png":
-                continue
-            img = Image.open(os.path.join(pathicons, fname))
-            img = ImageTk.PhotoImage(img.resize((size, size), resample=Image.HAMMING))
-            icons[name] = img
+        with os.scandir(pathicons) as entries:
+            icon_files = [entry for entry in entries if entry.name.endswith(".png")]
+
+        cache_file = os.path.join(PATHCACHE, f".icons_{size}.pickle")
+        raw_icons = cls._load_icon_cache(cache_file, icon_files)
+        if raw_icons is None:
+            # Decode in background threads. tkinter images must be created in the main thread
+            with futures.ThreadPoolExecutor(max_workers=4) as executor:
+                decoded = {os.path.splitext(entry.name)[0]:
+                           executor.submit(cls._decode_icon, entry.path, size)
+                           for entry in icon_files}
+                raw_icons = {name: future.result() for name, future in decoded.items()}
+            cls._save_icon_cache(cache_file, raw_icons)
+
+        icons = {name: ImageTk.PhotoImage(Image.frombytes(*data))
+                 for name, data in raw_icons.items()}
         logger.debug(icons)
         return icons
 
+    @staticmethod
+    def _decode_icon(filename: str, size: int) -> Tuple[str, Tuple[int, int], bytes]:
+        """ Load and resize a single icon png file.
+
+        Parameters
+        ----------
+        filename: str
+            Full path to the icon png file
+        size: int
+            The width and height, in pixels, to resize the icon to
+
+        Returns
+        -------
+        tuple
+            The (`mode`, `size`, `data`) of the resized icon
+        """
+        img = Image.open(filename)
+        # Integer box reduce large sources close to the target size before the final resize
+        factor = max(1, min(img.size) // (size * 2))
+        if factor > 1:
+            img = img.reduce(factor)
+        img = img.resize((size, size), resample=Image.BILINEAR)
+        return img.mode, img.size, img.tobytes()
+
+    @staticmethod
+    def _load_icon_cache(cache_file: str,
+                         icon_files: List[os.DirEntry]
+                         ) -> Optional[Dict[str, Tuple[str, Tuple[int, int], bytes]]]:
+        """ Load the resized raw icon data from the icon cache file, if it is valid.
+
+        Parameters
+        ----------
+        cache_file: str
+            Full path to the icon cache file for the requested icon size
+        icon_files: list
+            The :class:`os.DirEntry` objects for each source icon png file
+
+        Returns
+        -------
+        dict or ``None``
+            The icon name as key with the (`mode`, `size`, `data`) of the resized icon as value.
+            ``None`` if the cache does not exist, is out of date or could not be read
+        """
+        if not os.path.isfile(cache_file):
+            logger.debug("No icon cache: '%s'", cache_file)
+            return None
+        if icon_files and os.path.getmtime(cache_file) < max(entry.stat().st_mtime
+                                                             for entry in icon_files):
+            logger.debug("Icon cache is out of date: '%s'", cache_file)
+            return None
+        try:
+            retval = get_serializer("pickle").load(cache_file)
+        except FaceswapError as err:
+            logger.debug("Error loading icon cache: '%s'. Original error: %s", cache_file, err)
+            return None
+        if set(retval) != set(os.path.splitext(entry.name)[0] for entry in icon_files):
+            logger.debug("Icon cache does not match icons folder: '%s'", cache_file)
+            return None
+        logger.debug("Loaded icons from cache: '%s'", cache_file)
+        return retval
+
+    @staticmethod
+    def _save_icon_cache(cache_file: str,
+                         raw_icons: Dict[str, Tuple[str, Tuple[int, int], bytes]]) -> None:
+        """ Save the resized raw icon data to the icon cache file.
+
+        Failure to write the cache is not fatal, the icons will be regenerated on next launch.
+
+        Parameters
+        ----------
+        cache_file: str
+            Full path to the icon cache file for the requested icon size
+        raw_icons: dict
+            The icon name as key with the (`mode`, `size`, `data`) of the resized icon as value
+        """
+        try:
+            get_serializer("pickle").save(cache_file, raw_icons)
+        except FaceswapError as err:
+            logger.debug("Error saving icon cache: '%s'. Original error: %s", cache_file, err)
+            return
+        logger.debug("Saved icon cache: '%s'", cache_file)
+
     def set_faceswap_output_path(self, location: str, batch_mode: bool = False) -> None:
         """ Set the path that will contain the output from an Extract or Convert task.
 
@@ -546,18 +693,19 @@ class Images():
         Should be called when terminating tasks, or when Faceswap starts up or shuts down.
         """
         logger.debug("Deleting previews")
-        for item in os.listdir(self._pathpreview):
-            if item.startswith(".gui_training_preview") and item.endswith(".jpg"):
-                fullitem = os.path.join(self._pathpreview, item)
-                logger.debug("Deleting: '%s'", fullitem)
-                os.remove(fullitem)
-        for fname in cast(List[str], self._previewcache["filenames"]):
-            if os.path.basename(fname) == ".gui_preview.jpg":
-                logger.debug("Deleting: '%s'", fname)
-                try:
-                    os.remove(fname)
-                except FileNotFoundError:
-                    logger.debug("File does not exist: %s", fname)
+        with os.scandir(self._pathpreview) as entries:
+            for entry in entries:
+                if entry.name.startswith(".gui_training_preview") and entry.name.endswith(".jpg"):
+                    logger.debug("Deleting: '%s'", entry.path)
+                    os.remove(entry.path)
+        gui_previews = set(fname for fname in self._previewcache.filenames
+                           if os.path.basename(fname) == ".gui_preview.jpg")
+        for fname in gui_previews:
+            logger.debug("Deleting: '%s'", fname)
+            try:
+                os.remove(fname)
+            except FileNotFoundError:
+                logger.debug("File does not exist: %s", fname)
         self._clear_image_cache()
 
     def _clear_image_cache(self) -> None:
@@ -567,13 +715,11 @@ class Images():
         self._batch_mode = False
         self._previewoutput = None
         self._previewtrain = {}
-        self._previewcache = dict(modified=None,  # cache for extract and convert
-                                  images=None,
-                                  filenames=[],
-                                  placeholder=None)
+        self._previewcache = _PreviewCache()
+        self._preview_layout = None
 
     @staticmethod
-    def _get_images(image_path: str) -> List[str]:
+    def _get_images(image_path: str) -> List[os.DirEntry]:
         """ Get the images stored within the given directory.
 
         Parameters
@@ -584,16 +730,17 @@ class Images():
         Returns
         -------
         list:
-            The image filenames stored within the given folder
+            The :class:`os.DirEntry` objects for the images stored within the given folder
 
         """
         logger.debug("Getting images: '%s'", image_path)
         if not os.path.isdir(image_path):
             logger.debug("Folder does not exist")
             return []
-        files = [os.path.join(image_path, f)
-                 for f in os.listdir(image_path) if f.lower().endswith((".png", ".jpg"))]
-        logger.debug("Image files: %s", files)
+        with os.scandir(image_path) as entries:
+            files = [entry for entry in entries
+                     if entry.name.endswith((".png", ".jpg", ".PNG", ".JPG"))]
+        logger.debug("Image files: %s", [entry.path for entry in files])
         return files
 
     def load_latest_preview(self, thumbnail_size: int, frame_dims: Tuple[int, int]) -> None:
@@ -614,37 +761,49 @@ class Images():
                      thumbnail_size, frame_dims)
         assert self._pathoutput is not None
         image_path = self._get_newest_folder() if self._batch_mode else self._pathoutput
-        image_files = self._get_images(image_path)
+        if self._is_folder_unchanged(image_path):
+            logger.debug("No changes in output folder")
+            return
+        image_entries = self._get_images(image_path)
         gui_preview = os.path.join(self._pathoutput, ".gui_preview.jpg")
-        if not image_files or (len(image_files) == 1 and gui_preview not in image_files):
+        preview_entry = next((entry for entry in image_entries if entry.path == gui_preview),
+                             None)
+        if not image_entries or (len(image_entries) == 1 and preview_entry is None):
             logger.debug("No preview to display")
             return
         # Filter to just the gui_preview if it exists in folder output
-        image_files = [gui_preview] if gui_preview in image_files else image_files
-        logger.debug("Image Files: %s", len(image_files))
+        image_entries = [preview_entry] if preview_entry is not None else image_entries
+        logger.debug("Image Files: %s", len(image_entries))
 
-        image_files = self._get_newest_filenames(image_files)
-        if not image_files:
+        image_entries = self._get_newest_filenames(image_entries)
+        if not image_entries:
             return
 
-        if not self._load_images_to_cache(image_files, frame_dims, thumbnail_size):
+        if not self._load_images_to_cache(image_entries, frame_dims, thumbnail_size):
             logger.debug("Failed to load any preview images")
-            if gui_preview in image_files:
+            if preview_entry is not None:
                 # Reset last modified for failed loading of a gui preview image so it is picked
                 # up next time
-                self._previewcache["modified"] = None
+                self._previewcache.modified = None
+                self._previewcache.folder_modified = None
             return
 
-        if image_files == [gui_preview]:
+        if preview_entry is not None:
             # Delete the preview image so that the main scripts know to output another
             logger.debug("Deleting preview image")
-            os.remove(image_files[0])
+            os.remove(preview_entry.path)
         show_image = self._place_previews(frame_dims)
         if not show_image:
             self._previewoutput = None
             return
-        logger.debug("Displaying preview: %s", self._previewcache["filenames"])
-        self._previewoutput = (show_image, ImageTk.PhotoImage(show_image))
+        logger.debug("Displaying preview: %s", self._previewcache.filenames)
+        tk_image = self._previewoutput[1] if self._previewoutput is not None else None
+        if tk_image is not None and (tk_image.width(), tk_image.height()) == show_image.size:
+            # Update the existing tkinter image in place rather than allocating a new one
+            tk_image.paste(show_image)
+        else:
+            tk_image = ImageTk.PhotoImage(show_image)
+        self._previewoutput = (show_image, tk_image)
 
     def _get_newest_folder(self) -> str:
         """ Obtain the most recent folder created in the extraction output folder when processing
@@ -658,42 +817,92 @@ class Images():
 
         """
         assert self._pathoutput is not None
-        folders = [os.path.join(self._pathoutput, folder)
-                   for folder in os.listdir(self._pathoutput)
-                   if os.path.isdir(os.path.join(self._pathoutput, folder))]
-        folders.sort(key=os.path.getmtime)
-        retval = folders[-1] if folders else self._pathoutput
-        logger.debug("sorted folders: %s, return value: %s", folders, retval)
+        retval = self._pathoutput
+        newest = None
+        with os.scandir(self._pathoutput) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                mtime = entry.stat().st_mtime
+                if newest is None or mtime >= newest:
+                    newest = mtime
+                    retval = entry.path
+        logger.debug("newest folder modified: %s, return value: %s", newest, retval)
         return retval
 
-    def _get_newest_filenames(self, image_files: List[str]) -> List[str]:
-        """ Return image filenames that have been modified since the last check.
+    def _is_folder_unchanged(self, image_path: str) -> bool:
+        """ Check whether any files have been added to or removed from the given folder since the
+        last check, from the folder's own modification time.
+
+        This allows a single stat of the folder to replace a stat of every file within it when
+        nothing has changed. Folder modification times from the last 2 seconds are not cached, as
+        file systems with coarse timestamps may not register further changes within that window.
+
+        A folder's modification time does not change when an existing file is overwritten in
+        place, for example when outputting to a folder that already contains output from a
+        previous run. To pick up these files, the folder is reported as changed, so that every
+        file gets checked, once every :attr:`_full_scan_interval` checks.
+
+        Parameters
+        ----------
+        image_path: str
+            The folder containing images to be checked
+
+        Returns
+        -------
+        bool
+            ``True`` if the folder is unchanged since the last check otherwise ``False``
+        """
+        if not os.path.isdir(image_path):
+            return False
+        folder_modified = (image_path, os.stat(image_path).st_mtime)
+        cache = self._previewcache
+        if (folder_modified == cache.folder_modified
+                and cache.skipped_scans < self._full_scan_interval - 1):
+            cache.skipped_scans += 1
+            return True
+        cache.skipped_scans = 0
+        recent = time.time() - folder_modified[1] < 2.0
+        cache.folder_modified = None if recent else folder_modified
+        return False
+
+    def _get_newest_filenames(self, image_files: List[os.DirEntry]) -> List[os.DirEntry]:
+        """ Return image files that have been modified since the last check.
+
+        Each file is only stat'd once, both for filtering and for obtaining the new latest
+        modified time.
 
         Parameters
         ----------
         image_files: list
-            The list of image files to check the modification date for
+            The :class:`os.DirEntry` objects for the image files to check the modification date
+            for
 
         Returns
         -------
         list:
-            A list of images that have been modified since the last check
+            The :class:`os.DirEntry` objects for images that have been modified since the last
+            check
         """
-        if self._previewcache["modified"] is None:
-            retval = image_files
-        else:
-            retval = [fname for fname in image_files
-                      if os.path.getmtime(fname) > cast(float, self._previewcache["modified"])]
+        last_modified = self._previewcache.modified
+        newest = last_modified
+        retval = []
+        for entry in image_files:
+            mtime = entry.stat().st_mtime
+            if last_modified is not None and mtime <= last_modified:
+                continue
+            retval.append(entry)
+            newest = mtime if newest is None else max(newest, mtime)
         if not retval:
             logger.debug("No new images in output folder")
         else:
-            self._previewcache["modified"] = max(os.path.getmtime(img) for img in retval)
+            self._previewcache.modified = newest
             logger.debug("Number new images: %s, Last Modified: %s",
-                         len(retval), self._previewcache["modified"])
+                         len(retval), self._previewcache.modified)
         return retval
 
     def _load_images_to_cache(self,
-                              image_files: List[str],
+                              image_files: List[os.DirEntry],
                               frame_dims: Tuple[int, int],
                               thumbnail_size: int) -> bool:
         """ Load preview images to the image cache.
@@ -704,7 +913,8 @@ class Images():
         Parameters
         ----------
         image_files: list
-            A list of new image files that have been modified since the last check
+            The :class:`os.DirEntry` objects for new image files that have been modified since
+            the last check
         frame_dims: tuple
             The (width (`int`), height (`int`)) of the display panel that will display the preview
         thumbnail_size: int
@@ -723,43 +933,100 @@ class Images():
             return False
         samples: List[np.ndarray] = []
         start_idx = len(image_files) - num_images if len(image_files) > num_images else 0
-        show_files = sorted(image_files, key=os.path.getctime)[start_idx:]
-        dropped_files = []
-        for fname in show_files:
-            try:
-                img = Image.open(fname)
-            except PermissionError as err:
-                logger.debug("Permission error opening preview file: '%s'. Original error: %s",
-                             fname, str(err))
-                dropped_files.append(fname)
-                continue
-            except Exception as err:  # pylint:disable=broad-except
-                # Swallow any issues with opening an image rather than spamming console
-                # Can happen when trying to read partially saved images
-                logger.debug("Error opening preview file: '%s'. Original error: %s",
-                             fname, str(err))
-                dropped_files.append(fname)
-                continue
-
-            width, height = img.size
-            scaling = thumbnail_size / max(width, height)
-            logger.debug("image width: %s, height: %s, scaling: %s", width, height, scaling)
-
-            try:
-                img = img.resize((int(width * scaling), int(height * scaling)))
-            except OSError as err:
-                # Image only gets loaded when we call a method, so may error on partial loads
-                logger.debug("OS Error resizing preview image: '%s'. Original error: %s",
-                             fname, err)
-                dropped_files.append(fname)
+        # Directory entries hold the stat result from the modified check, so are not stat'd again
+        image_files = sorted(image_files, key=lambda entry: entry.stat().st_ctime)
+        show_files = [entry.path for entry in image_files[start_idx:]]
+        dropped_files: Set[str] = set()
+        # Results are collected in submission order, as this dictates display order
+        loading = [self._executor.submit(self._load_preview_sample, fname, thumbnail_size)
+                   for fname in show_files]
+        for fname, future in zip(show_files, loading):
+            sample = future.result()
+            if sample is None:
+                dropped_files.add(fname)
                 continue
-
-            samples.append(self._pad_and_border(img, thumbnail_size))
+            samples.append(sample)
 
         return self._process_samples(samples,
                                      [fname for fname in show_files if fname not in dropped_files],
                                      num_images)
 
+    def _load_preview_sample(self, filename: str, thumbnail_size: int) -> Optional[np.ndarray]:
+        """ Load a single preview image and format it as a thumbnail for display.
+
+        Executed in a background thread from :func:`_load_images_to_cache`.
+
+        Parameters
+        ----------
+        filename: str
+            Full path to the preview image to load
+        thumbnail_size: int
+            The size of the thumbnail that should be created
+
+        Returns
+        -------
+        :class:`numpy.ndarray` or ``None``
+            The padded and bordered thumbnail. ``None`` if the image could not be loaded
+        """
+        try:
+            img = self._open_preview_image(filename, thumbnail_size)
+        except PermissionError as err:
+            logger.debug("Permission error opening preview file: '%s'. Original error: %s",
+                         filename, str(err))
+            return None
+        except Exception as err:  # pylint:disable=broad-except
+            # Swallow any issues with opening an image rather than spamming console
+            # Can happen when trying to read partially saved images
+            logger.debug("Error opening preview file: '%s'. Original error: %s",
+                         filename, str(err))
+            return None
+
+        width, height = img.size
+        scaling = thumbnail_size / max(width, height)
+        logger.trace("image width: %s, height: %s, scaling: %s",  # type: ignore
+                     width, height, scaling)
+
+        try:
+            if scaling < 1.0:
+                img.thumbnail((thumbnail_size, thumbnail_size), Image.BILINEAR)
+            elif scaling > 1.0:  # thumbnail will not enlarge images
+                img = img.resize((int(width * scaling), int(height * scaling)), Image.BILINEAR)
+        except OSError as err:
+            # Image only gets loaded when we call a method, so may error on partial loads
+            logger.debug("OS Error resizing preview image: '%s'. Original error: %s",
+                         filename, err)
+            return None
+
+        return self._pad_and_border(img, thumbnail_size)
+
+    @staticmethod
+    def _open_preview_image(filename: str, thumbnail_size: int) -> Image.Image:
+        """ Open and fully decode a preview image.
+
+        The image is decoded whilst the file is open, rather than lazily on first use, so that
+        errors from reading partially written files are raised here. JPEG images are decoded at a
+        reduced scale if they are significantly larger than the thumbnail size.
+
+        Parameters
+        ----------
+        filename: str
+            Full path to the preview image to open
+        thumbnail_size: int
+            The size of the thumbnail that will be created from the image
+
+        Returns
+        -------
+        :class:`PIL.Image`
+            The fully loaded preview image
+        """
+        with open(filename, "rb") as in_file:
+            img = Image.open(in_file)
+            if img.format == "JPEG":
+                # Have the decoder scale down on load. Must be set prior to reading the size
+                img.draft("RGB", (thumbnail_size * 2, thumbnail_size * 2))
+            img.load()
+        return img
+
     def _pad_and_border(self, image: Image.Image, size: int) -> np.ndarray:
         """ Pad rectangle images to a square and draw borders
 
@@ -772,20 +1039,45 @@ class Images():
 
         Returns
         -------
-        :class:`PIL.Image`:
-            The processed image
+        :class:`numpy.ndarray`:
+            The processed (`size`, `size`, 3) image
         """
-        if image.size[0] != image.size[1]:
-            # Pad to square
-            new_img = Image.new("RGB", (size, size))
-            new_img.paste(image, ((size - image.size[0]) // 2, (size - image.size[1]) // 2))
-            image = new_img
-        draw = ImageDraw.Draw(image)
-        draw.rectangle(((0, 0), (size, size)), outline="#E5E5E5", width=1)
-        retval = np.array(image)
-        logger.trace("image shape: %s", retval.shape)  # type: ignore
+        image = image if image.mode == "RGB" else image.convert("RGB")
+        source = np.asarray(image)
+        height, width = source.shape[:2]
+        # Pad to square, placing the image inside the template's border
+        retval = self._get_border_template(size).copy()
+        top, left = (size - height) // 2, (size - width) // 2
+        y_start, x_start = max(top, 1), max(left, 1)
+        retval[y_start:top + height, x_start:left + width] = source[y_start - top:,
+                                                                    x_start - left:]
         return retval
 
+    def _get_border_template(self, size: int) -> np.ndarray:
+        """ Obtain a blank, bordered thumbnail of the given size. The template is created on the
+        first request for each size and then re-used.
+
+        Parameters
+        ----------
+        size: int
+            The size of the thumbnail
+
+        Returns
+        -------
+        :class:`numpy.ndarray`
+            The read-only (`size`, `size`, 3) bordered template
+        """
+        template = self._border_templates.get(size)
+        if template is None:
+            logger.debug("Creating border template. size: %s", size)
+            template = np.zeros((size, size, 3), dtype="uint8")
+            # Border the top and left edges to give grid lines between thumbnails
+            template[0, :] = 0xE5
+            template[:, 0] = 0xE5
+            template.flags.writeable = False
+            self._border_templates[size] = template
+        return template
+
     def _process_samples(self,
                          samples: List[np.ndarray],
                          filenames: List[str],
@@ -806,24 +1098,70 @@ class Images():
         bool
             ``True`` if samples succesfully compiled otherwise ``False``
         """
-        asamples = np.array(samples)
-        if not np.any(asamples):
+        if not samples:
             logger.debug("No preview images collected.")
             return False
 
-        self._previewcache["filenames"] = (cast(List[str], self._previewcache["filenames"]) +
-                                           filenames)[-num_images:]
-        cache = cast(Optional[np.ndarray], self._previewcache["images"])
-        if cache is None:
-            logger.debug("Creating new cache")
-            cache = asamples[-num_images:]
+        cache = self._previewcache
+        new_samples = samples[-num_images:]
+        if cache.images is None or cache.images.shape != (num_images, *new_samples[0].shape):
+            self._allocate_cache(num_images, new_samples[0].shape)
         else:
             logger.debug("Appending to existing cache")
-            cache = np.concatenate((cache, asamples))[-num_images:]
-        self._previewcache["images"] = cache
-        logger.debug("Cache shape: %s", cast(np.ndarray, self._previewcache["images"]).shape)
+        assert cache.images is not None
+        # Only the new samples are copied, overwriting the oldest images in the ring buffer
+        for sample in new_samples:
+            cache.images[cache.head] = sample
+            cache.head = (cache.head + 1) % num_images
+        cache.filled = min(cache.filled + len(new_samples), num_images)
+        cache.filenames.extend(filenames)
+        logger.debug("Cache shape: %s, filled: %s", cache.images.shape, cache.filled)
         return True
 
+    def _allocate_cache(self, num_images: int, sample_shape: Tuple[int, ...]) -> None:
+        """ Allocate the preview image ring buffer for the given number of images, retaining the
+        most recent existing images, if they are of the same size.
+
+        Parameters
+        ----------
+        num_images: int
+            The number of images that the cache should hold
+        sample_shape: tuple
+            The (`height`, `width`, `channels`) shape of each thumbnail image
+        """
+        logger.debug("Creating new cache: (num_images: %s, sample_shape: %s)",
+                     num_images, sample_shape)
+        cache = self._previewcache
+        images = np.empty((num_images, *sample_shape), dtype="uint8")
+        existing = self._get_cached_images()
+        retain = 0
+        if existing is not None and existing.shape[1:] == sample_shape:
+            retain = min(len(existing), num_images)
+            images[:retain] = existing[len(existing) - retain:]
+        filenames = list(cache.filenames)
+        cache.filenames = deque(filenames[len(filenames) - retain:], maxlen=num_images)
+        cache.images = images
+        cache.head = retain % num_images
+        cache.filled = retain
+
+    def _get_cached_images(self) -> Optional[np.ndarray]:
+        """ Obtain the images held in the preview cache ring buffer, ordered oldest to newest.
+
+        Returns
+        -------
+        :class:`numpy.ndarray` or ``None``
+            The cached images. A view of the ring buffer if the images do not wrap around the end
+            of the buffer, otherwise a copy. ``None`` if there are no cached images
+        """
+        cache = self._previewcache
+        if cache.images is None or not cache.filled:
+            return None
+        capacity = len(cache.images)
+        start = (cache.head - cache.filled) % capacity
+        if start + cache.filled <= capacity:
+            return cache.images[start:start + cache.filled]
+        return np.take(cache.images, np.arange(start, start + cache.filled) % capacity, axis=0)
+
     def _place_previews(self, frame_dims: Tuple[int, int]) -> Image.Image:
         """ Format the preview thumbnails stored in the cache into a grid fitting the display
         panel.
@@ -838,32 +1176,80 @@ class Images():
         :class:`PIL.Image`:
             The final preview display image
         """
-        if self._previewcache.get("images", None) is None:
+        cached = self._get_cached_images()
+        if cached is None:
             logger.debug("No images in cache. Returning None")
             return None
-        samples = cast(np.ndarray, self._previewcache["images"]).copy()
+        # Samples are only read from here on, so the cached images are used without a copy
+        samples = cached
         num_images, thumbnail_size = samples.shape[:2]
-        if self._previewcache["placeholder"] is None:
+        if self._previewcache.placeholder is None:
             self._create_placeholder(thumbnail_size)
 
         logger.debug("num_images: %s, thumbnail_size: %s", num_images, thumbnail_size)
-        cols, rows = frame_dims[0] // thumbnail_size, frame_dims[1] // thumbnail_size
-        logger.debug("cols: %s, rows: %s", cols, rows)
+        layout = self._get_layout(frame_dims, thumbnail_size)
+        cols, rows, display = layout.cols, layout.rows, layout.display
         if cols == 0 or rows == 0:
             logger.debug("Cols or Rows is zero. No items to display")
             return None
         remainder = (cols * rows) - num_images
-        if remainder != 0:
+        if remainder > 0:
             logger.debug("Padding sample display. Remainder: %s", remainder)
-            placeholder = np.concatenate([np.expand_dims(
-                cast(np.ndarray, self._previewcache["placeholder"]), 0)] * remainder)
-            samples = np.concatenate((samples, placeholder))
-
-        display = np.vstack([np.hstack(cast(Sequence, samples[row * cols: (row + 1) * cols]))
-                             for row in range(rows)])
+            placeholder = cast(np.ndarray, self._previewcache.placeholder)
+            padding = np.broadcast_to(placeholder, (remainder, *placeholder.shape))
+            samples = np.concatenate((samples, padding))
+
+        # Lay out the grid with a single copy into a (rows, height, cols, width, 3) view of the
+        # display buffer
+        grid = samples[:cols * rows].reshape(rows, cols, thumbnail_size, thumbnail_size, 3)
+        np.copyto(display.reshape(rows, thumbnail_size, cols, thumbnail_size, 3),
+                  grid.transpose(0, 2, 1, 3, 4))
         logger.debug("display shape: %s", display.shape)
+        # PIL copies RGB array data, so the returned image is independent of the display buffer
         return Image.fromarray(display)
 
+    def _get_layout(self, frame_dims: Tuple[int, int], thumbnail_size: int) -> _PreviewLayout:
+        """ Obtain the grid layout for the preview thumbnails and the buffer that they are placed
+        into for display.
+
+        The layout is re-used between preview updates and is only re-calculated, and the buffer
+        re-allocated, when the display dimensions or thumbnail size change.
+
+        Parameters
+        ----------
+        frame_dims: tuple
+            The (width (`int`), height (`int`)) of the display panel that will display the preview
+        thumbnail_size: int
+            The size of each thumbnail, in pixels
+
+        Returns
+        -------
+        :class:`_PreviewLayout`
+            The number of columns and rows of thumbnails that fit the display panel, and the
+            (`rows * thumbnail_size`, `cols * thumbnail_size`, 3) uint8 display buffer
+        """
+        dims = (frame_dims[0], frame_dims[1])
+        layout = self._preview_layout
+        if (layout is not None
+                and layout.frame_dims == dims
+                and layout.thumbnail_size == thumbnail_size):
+            return layout
+
+        cols, rows = frame_dims[0] // thumbnail_size, frame_dims[1] // thumbnail_size
+        logger.debug("Creating preview layout: (frame_dims: %s, thumbnail_size: %s, cols: %s, "
+                     "rows: %s)", frame_dims, thumbnail_size, cols, rows)
+        height, width = rows * thumbnail_size, cols * thumbnail_size
+        if layout is not None and layout.display.shape[:2] == (height, width):
+            display = layout.display  # Frame resized within the same grid
+        else:
+            display = np.empty((height, width, 3), dtype="uint8")
+        self._preview_layout = _PreviewLayout(frame_dims=dims,
+                                              thumbnail_size=thumbnail_size,
+                                              cols=cols,
+                                              rows=rows,
+                                              display=display)
+        return self._preview_layout
+
     def _create_placeholder(self, thumbnail_size: int) -> None:
         """ Create a placeholder image for when there are fewer thumbnails available
         than columns to display them.
@@ -874,11 +1260,8 @@ class Images():
             The size of the thumbnail that the placeholder should replicate
         """
         logger.debug("Creating placeholder. thumbnail_size: %s", thumbnail_size)
-        placeholder = Image.new("RGB", (thumbnail_size, thumbnail_size))
-        draw = ImageDraw.Draw(placeholder)
-        draw.rectangle(((0, 0), (thumbnail_size, thumbnail_size)), outline="#E5E5E5", width=1)
-        placeholder = np.array(placeholder)
-        self._previewcache["placeholder"] = placeholder
+        placeholder = self._get_border_template(thumbnail_size)
+        self._previewcache.placeholder = placeholder
         logger.debug("Created placeholder. shape: %s", placeholder.shape)
 
     def load_training_preview(self) -> None:
@@ -894,15 +1277,20 @@ class Images():
             logger.debug("No preview to display")
             self._previewtrain = {}
             return
-        for img in image_files:
-            modified = os.path.getmtime(img) if modified is None else modified
-            name = os.path.basename(img)
-            name = os.path.splitext(name)[0]
+        for entry in image_files:
+            img = entry.path
+            modified = entry.stat().st_mtime if modified is None else modified
+            name = os.path.splitext(entry.name)[0]
             name = name[name.rfind("_") + 1:].title()
             try:
                 logger.debug("Displaying preview: '%s'", img)
                 size = self._get_current_size(name)
-                self._previewtrain[name] = [Image.open(img), None, modified]
+                # Carry over the existing tkinter image so it can be updated in place
+                existing = self._previewtrain.get(name)
+                tk_image = None if existing is None else existing.tk_image
+                self._previewtrain[name] = _TrainPreview(image=Image.open(img),
+                                                         tk_image=tk_image,
+                                                         modified=modified)
                 self.resize_image(name, size)
                 self._errcount = 0
             except ValueError:
@@ -934,9 +1322,9 @@ class Images():
             The height of the training image
         """
         logger.debug("Getting size: '%s'", name)
-        if not self._previewtrain.get(name):
+        if name not in self._previewtrain:
             return None
-        img = cast(Image.Image, self._previewtrain[name][1])
+        img = self._previewtrain[name].tk_image
         if not img:
             return None
         logger.debug("Got size: (name: '%s', width: '%s', height: '%s')",
@@ -958,7 +1346,9 @@ class Images():
             ``None`` if the frame dimensions are not known.
         """
         logger.debug("Resizing image: (name: '%s', frame_dims: %s", name, frame_dims)
-        displayimg = cast(Image.Image, self._previewtrain[name][0])
+        preview = self._previewtrain[name]
+        displayimg = preview.image
+        size = displayimg.size
         if frame_dims:
             frameratio = float(frame_dims[0]) / float(frame_dims[1])
             imgratio = float(displayimg.size[0]) / float(displayimg.size[1])
@@ -971,18 +1361,33 @@ class Images():
                 size = (int(displayimg.size[0] * scale), frame_dims[1])
             logger.debug("Scaling: (scale: %s, size: %s", scale, size)
 
+        if preview.tk_image is not None and size == preview.last_size:
+            logger.debug("Image already displayed at requested size: '%s'", name)
+            return
+
+        if frame_dims:
             # Hacky fix to force a reload if it happens to find corrupted
             # data, probably due to reading the image whilst it is partially
-            # saved. If it continues to fail, then eventually raise.
-            for i in range(0, 1000):
+            # saved. Back off between attempts to give the writer time to finish, and
+            # raise if it continues to fail.
+            retries = 5
+            for i in range(retries):
                 try:
-                    displayimg = displayimg.resize(size, Image.ANTIALIAS)
+                    displayimg = displayimg.resize(size, Image.LANCZOS)
                 except OSError:
-                    if i == 999:
+                    if i == retries - 1:
                         raise
+                    time.sleep(0.01 * (1 << i))
                     continue
                 break
-        self._previewtrain[name][1] = ImageTk.PhotoImage(displayimg)
+
+        tk_image = preview.tk_image
+        if tk_image is not None and (tk_image.width(), tk_image.height()) == displayimg.size:
+            logger.debug("Updating existing tkinter image: '%s'", name)
+            tk_image.paste(displayimg)
+        else:
+            preview.tk_image = ImageTk.PhotoImage(displayimg)
+        preview.last_size = size
 
 
 @dataclass
@@ -1372,7 +1777,7 @@ class LongRunningTask(Thread):
         self._config = get_config()
         self._config.set_cursor_busy(widget=self._widget)
         self._complete = Event()
-        self._queue: Queue = Queue()
+        self._result: Any = None
         logger.debug("Initialized %s", self.__class__.__name__,)
 
     @property
@@ -1386,8 +1791,8 @@ class LongRunningTask(Thread):
         """ Commence the given task in a background thread. """
         try:
             if self._target:
-                retval = self._target(*self._args, **self._kwargs)
-                self._queue.put(retval)
+                # Only read once the complete event is set, which orders the write before the read
+                self._result = self._target(*self._args, **self._kwargs)
         except Exception:  # pylint: disable=broad-except
             self.err = cast(Tuple[Type[BaseException], BaseException, "TracebackType"],
                             sys.exc_info())
@@ -1420,7 +1825,7 @@ class LongRunningTask(Thread):
             raise self.err[1].with_traceback(self.err[2])
 
         logger.debug("Getting result from thread")
-        retval = self._queue.get()
+        retval = self._result
         logger.debug("Got result from thread")
         self._config.set_cursor_default(widget=self._widget)
         return retval
@@ -1449,10 +1854,9 @@ class PreviewTrigger():
             mask on and off
          """
         trigger = self._trigger_files[trigger_type]
-        if not os.path.isfile(trigger):
-            with open(trigger, "w", encoding="utf8"):
-                pass
-            logger.debug("Set preview trigger: %s", trigger)
+        # Creates the file if it does not exist, otherwise leaves it untouched
+        os.close(os.open(trigger, os.O_WRONLY | os.O_CREAT, 0o644))
+        logger.debug("Set preview trigger: %s", trigger)
 
     def clear(self, trigger_type: Optional[Literal["update", "mask_toggle"]] = None) -> None:
         """ Remove the trigger file from the cache folder.
@@ -1468,9 +1872,11 @@ class PreviewTrigger():
         else:
             triggers = [self._trigger_files[trigger_type]]
         for trigger in triggers:
-            if os.path.isfile(trigger):
+            try:
                 os.remove(trigger)
-                logger.debug("Removed preview trigger: %s", trigger)
+            except FileNotFoundError:
+                continue
+            logger.debug("Removed preview trigger: %s", trigger)
 
 
 def preview_trigger() -> PreviewTrigger: